@@ -25,14 +25,10 @@ class DraperAdder:
         Returns:
             List[float]: List of phase angles
         """
-        angles = []
-        for i in range(n_qubits):
-            angle = 0
-            for j in range(i + 1):
-                if number & (1 << j):
-                    angle += 2 * np.pi / (2 ** (i - j + 1))
-            angles.append(angle)
-        return angles
+        # The angle on qubit i is 2*pi * sum_{j<=i} bit_j * 2^j / 2^(i+1),
+        # i.e. the low i+1 bits of the number over 2^(i+1); Python ints keep
+        # this exact for registers wider than 63 qubits
+        return [2 * np.pi * (number % (1 << k)) / (1 << k) for k in range(1, n_qubits + 1)]
     
     def construct_adder(self, a: int, b: int, n_qubits: int) -> QuantumCircuit:
         """
@@ -57,18 +53,27 @@ class DraperAdder:
             if a & (1 << i):
                 circuit.x(i)
         
-        # Apply QFT
-        qft_circuit = self.qft.construct_qft(n_qubits)
-        circuit.compose(qft_circuit, inplace=True)
+        # The QFT treats qubit 0 as the most significant bit, while a is
+        # encoded little-endian, so it is applied to the reversed register
+        qubit_order = list(reversed(range(n_qubits)))
+        
+        # Apply QFT; the inverse QFT undoes its qubit order, so the swaps
+        # on both sides are skipped
+        qft_circuit = self.qft.construct_qft(n_qubits, do_swaps=False)
+        circuit.compose(qft_circuit, qubits=qubit_order, inplace=True)
         
-        # Add phase angles corresponding to b
+        # Adding b in the Fourier basis is diagonal: without the swaps,
+        # qubit i takes a single phase of 2*pi * b / 2^(i+1)
         angles = self._binary_to_phase_angles(b, n_qubits)
         for i in range(n_qubits):
-            circuit.p(angles[i], i)
+            # Skip identity phases (angle = 0 mod 2*pi)
+            angle = angles[i] % (2 * np.pi)
+            if abs(angle) > 1e-12 and abs(angle - 2 * np.pi) > 1e-12:
+                circuit.p(angle, i)
         
         # Apply inverse QFT
-        inverse_qft_circuit = self.qft.construct_inverse_qft(n_qubits)
-        circuit.compose(inverse_qft_circuit, inplace=True)
+        inverse_qft_circuit = self.qft.construct_inverse_qft(n_qubits, do_swaps=False)
+        circuit.compose(inverse_qft_circuit, qubits=qubit_order, inplace=True)
         
         # Add measurement
         circuit.measure(range(n_qubits), range(n_qubits))
@@ -1,27 +1,86 @@
+import numpy as np
+from functools import lru_cache
 from qiskit import QuantumCircuit
+from qiskit.circuit.library import get_standard_gate_name_mapping
 from qiskit.synthesis import OneQubitEulerDecomposer
 from qiskit.converters import circuit_to_dag
 
+# U(theta, phi, lambda) angles of standard fixed single-qubit gates
+KNOWN_ZSX = {
+    'h': (np.pi / 2, 0.0, np.pi),
+    'y': (np.pi, np.pi / 2, np.pi / 2),
+    'z': (0.0, 0.0, np.pi),
+    's': (0.0, 0.0, np.pi / 2),
+    'sdg': (0.0, 0.0, -np.pi / 2),
+    't': (0.0, 0.0, np.pi / 4),
+    'tdg': (0.0, 0.0, -np.pi / 4),
+}
+
+# U(theta, phi, lambda) angles of standard parameterized single-qubit gates
+PARAMETERIZED_ZSX = {
+    'rx': lambda theta: (theta, -np.pi / 2, np.pi / 2),
+    'ry': lambda theta: (theta, 0.0, 0.0),
+    'p': lambda lambda_: (0.0, 0.0, lambda_),
+    'u1': lambda lambda_: (0.0, 0.0, lambda_),
+    'u': lambda theta, phi, lambda_: (theta, phi, lambda_),
+    'u3': lambda theta, phi, lambda_: (theta, phi, lambda_),
+}
+
+_STANDARD_GATES = get_standard_gate_name_mapping()
+_EULER_DECOMPOSER = OneQubitEulerDecomposer(basis='ZSX')
+
+
+def _is_standard_gate(gate) -> bool:
+    """Whether the gate is a Qiskit standard-library gate, not a custom gate reusing its name."""
+    standard_gate = _STANDARD_GATES.get(gate.name)
+    return standard_gate is not None and type(gate) is type(standard_gate)
+
+
+def _zsx_sequence(theta: float, phi: float, lambda_: float) -> tuple:
+    """ZSX gate sequence, in circuit order, of U(theta, phi, lambda)."""
+    # U(theta, phi, lambda) = RZ(phi + pi) SX RZ(theta + pi) SX RZ(lambda)
+    return (('rz', lambda_), ('sx',), ('rz', theta + np.pi), ('sx',), ('rz', phi + np.pi))
+
+
+@lru_cache(maxsize=1024)
+def _standard_zsx_decomposition(name: str, params: tuple) -> tuple:
+    """ZSX gate sequence of a standard-library gate, cached by name and bound params."""
+    if name in KNOWN_ZSX:
+        return _zsx_sequence(*KNOWN_ZSX[name])
+    if name in PARAMETERIZED_ZSX:
+        return _zsx_sequence(*PARAMETERIZED_ZSX[name](*params))
+    gate = type(_STANDARD_GATES[name])(*params)
+    return _zsx_sequence(*_EULER_DECOMPOSER.angles(gate.to_matrix()))
+
 
 class GateBasisTransformer:
     def __init__(self):
         self.basis_gates = {'cx', 'id', 'rz', 'sx', 'x'}
         self.euler_decomposer = OneQubitEulerDecomposer(basis='ZSX')
         
-    def _decompose_single_qubit_gate(self, gate, qubit):
-        matrix = gate.to_matrix() if hasattr(gate, 'to_matrix') else gate
-        temp_circuit = QuantumCircuit(1)
-        theta, phi, lambda_ = self.euler_decomposer.angles(matrix)
+    def _decompose_single_qubit_gate(self, gate):
+        if gate.is_parameterized():
+            raise ValueError(f"Cannot decompose gate '{gate.name}' with unbound parameters")
         
-        temp_circuit.rz(phi, 0)
-        temp_circuit.sx(0)
-        temp_circuit.rz(theta, 0)
-        temp_circuit.sx(0)
-        temp_circuit.rz(lambda_, 0)
-        
-        return [(gate, [qubit]) for gate, _, _ in temp_circuit.data]
+        # Only standard gates are cached: a custom gate's definition is not
+        # determined by its name and params
+        if _is_standard_gate(gate):
+            return _standard_zsx_decomposition(gate.name, tuple(float(param) for param in gate.params))
+        return _zsx_sequence(*self.euler_decomposer.angles(gate.to_matrix()))
+    
+    def _append_single_qubit_gate(self, circuit, gate, qubit):
+        for decomp_gate in self._decompose_single_qubit_gate(gate):
+            if decomp_gate[0] == 'rz':
+                circuit.rz(decomp_gate[1], qubit)
+            else:
+                circuit.sx(qubit)
         
     def transform_circuit(self, circuit: QuantumCircuit) -> QuantumCircuit:
+        # Circuits already in the basis need no DAG roundtrip
+        if all(inst.operation.name.lower() in self.basis_gates or inst.operation.name == 'measure'
+               for inst in circuit.data):
+            return circuit.copy()
+        
         new_circuit = QuantumCircuit(circuit.num_qubits, circuit.num_clbits)
         dag = circuit_to_dag(circuit)
         
@@ -29,16 +88,15 @@ class GateBasisTransformer:
             qubits = node.qargs
             gate = node.op
             
-            # Skip non-unitary operations such as measurements
+            # Measurements are native to the basis and pass through unchanged
             if gate.name == 'measure':
+                new_circuit.append(gate, qubits, node.cargs)
                 continue
             
             if gate.name.lower() in self.basis_gates:
                 new_circuit.append(gate, qubits)
             elif len(qubits) == 1:
-                decomposed_gates = self._decompose_single_qubit_gate(gate, qubits[0])
-                for decomp_gate, decomp_qubits in decomposed_gates:
-                    new_circuit.append(decomp_gate, decomp_qubits)
+                self._append_single_qubit_gate(new_circuit, gate, qubits[0])
             elif gate.name == 'cx':
                 new_circuit.append(gate, qubits)
             else:
@@ -46,12 +104,11 @@ class GateBasisTransformer:
                 temp_circuit.append(gate, list(range(len(qubits))))
                 decomposed = temp_circuit.decompose()
                 for inst in decomposed.data:
-                    inst_gate, inst_qubits, _ = inst
+                    inst_gate = inst.operation
+                    inst_qubits = inst.qubits
                     if len(inst_qubits) == 1:
                         original_qubit = qubits[temp_circuit.qubits.index(inst_qubits[0])]
-                        decomp_gates = self._decompose_single_qubit_gate(inst_gate, original_qubit)
-                        for decomp_gate, decomp_qubits in decomp_gates:
-                            new_circuit.append(decomp_gate, decomp_qubits)
+                        self._append_single_qubit_gate(new_circuit, inst_gate, original_qubit)
                     else:
                         mapped_qubits = [qubits[temp_circuit.qubits.index(q)] for q in inst_qubits]
                         new_circuit.append(inst_gate, mapped_qubits)
@@ -61,7 +118,7 @@ class GateBasisTransformer:
     def get_gate_counts(self, circuit: QuantumCircuit) -> dict:
         counts = {gate: 0 for gate in self.basis_gates}
         for instruction in circuit.data:
-            gate_name = instruction[0].name.lower()
+            gate_name = instruction.operation.name.lower()
             if gate_name in counts:
                 counts[gate_name] += 1
         return counts
\ No newline at end of file
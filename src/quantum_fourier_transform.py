@@ -1,62 +1,88 @@
 import numpy as np
+from functools import lru_cache
 from qiskit import QuantumCircuit
+from qiskit.circuit.library import CPhaseGate, HGate
 
 class QuantumFourierTransform:
     """
     Implementation of Quantum Fourier Transform from scratch.
     """
     
-    @staticmethod
-    def _create_cphase_gate(circuit: QuantumCircuit, control: int, target: int, k: int):
-        """
-        Creates a controlled phase rotation gate.
-        
-        Args:
-            circuit (QuantumCircuit): Circuit to add the gate to
-            control (int): Control qubit index
-            target (int): Target qubit index
-            k (int): Phase rotation parameter
-        """
-        angle = 2 * np.pi / (2 ** k)
-        circuit.cp(angle, control, target)
-    
-    def construct_qft(self, n_qubits: int) -> QuantumCircuit:
+    def construct_qft(self, n_qubits: int, do_swaps: bool = True) -> QuantumCircuit:
         """
         Constructs the Quantum Fourier Transform circuit.
         
         Args:
             n_qubits (int): Number of qubits in the circuit
+            do_swaps (bool): Whether to reverse the output qubit order
             
         Returns:
             QuantumCircuit: QFT circuit
         """
-        circuit = QuantumCircuit(n_qubits)
-        
-        # Implement QFT
-        for i in range(n_qubits):
-            # Hadamard gate on current qubit
-            circuit.h(i)
-            
-            # Controlled phase rotations
-            for j in range(i + 1, n_qubits):
-                k = j - i + 1
-                self._create_cphase_gate(circuit, j, i, k)
-        
-        # Swap qubits to match standard QFT output order
-        for i in range(n_qubits // 2):
-            circuit.swap(i, n_qubits - i - 1)
-            
-        return circuit
+        return _build_qft(n_qubits, do_swaps).copy()
     
-    def construct_inverse_qft(self, n_qubits: int) -> QuantumCircuit:
+    def construct_inverse_qft(self, n_qubits: int, do_swaps: bool = True) -> QuantumCircuit:
         """
         Constructs the inverse Quantum Fourier Transform circuit.
         
         Args:
             n_qubits (int): Number of qubits in the circuit
+            do_swaps (bool): Whether to reverse the input qubit order
             
         Returns:
             QuantumCircuit: Inverse QFT circuit
         """
-        qft = self.construct_qft(n_qubits)
-        return qft.inverse()
\ No newline at end of file
+        return _build_inverse_qft(n_qubits, do_swaps).copy()
+
+
+def _qft_angles(n_qubits):
+    """
+    Computes the controlled phase angles of the QFT.
+    
+    The phase only depends on the distance between control and target, so
+    one angle per distance covers the whole circuit.
+    
+    Args:
+        n_qubits (int): Number of qubits in the circuit
+        
+    Returns:
+        np.ndarray: Array of length n_qubits where entry d is the phase
+            applied to a target by a control d qubits away (entry 0 is unused)
+    """
+    angles = np.zeros(n_qubits)
+    for d in range(1, n_qubits):
+        angles[d] = 2 * np.pi / (2.0 ** (d + 1))
+    return angles
+
+
+@lru_cache(maxsize=None)
+def _build_qft(n_qubits: int, do_swaps: bool = True) -> QuantumCircuit:
+    """Build the QFT circuit once per register size; callers get copies."""
+    circuit = QuantumCircuit(n_qubits)
+    angles = _qft_angles(n_qubits)
+    
+    # Gate instances are shared across the circuit, one per control-target distance
+    h_gate = HGate()
+    cphase_gates = [CPhaseGate(angle) for angle in angles]
+    
+    # Implement QFT
+    for i in range(n_qubits):
+        # Hadamard gate on current qubit
+        circuit.append(h_gate, [i])
+        
+        # Controlled phase rotations
+        for j in range(i + 1, n_qubits):
+            circuit.append(cphase_gates[j - i], [j, i])
+    
+    # Swap qubits to match standard QFT output order
+    if do_swaps:
+        for i in range(n_qubits // 2):
+            circuit.swap(i, n_qubits - i - 1)
+    
+    return circuit
+
+
+@lru_cache(maxsize=None)
+def _build_inverse_qft(n_qubits: int, do_swaps: bool = True) -> QuantumCircuit:
+    """Build the inverse QFT circuit once per register size; callers get copies."""
+    return _build_qft(n_qubits, do_swaps).inverse()
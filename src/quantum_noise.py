@@ -1,9 +1,38 @@
 from qiskit import QuantumCircuit
-import random
+from qiskit.circuit.library import XGate, YGate, ZGate
+import numpy as np
+from typing import Optional, Tuple
+
+# Label carried by injected Pauli errors, so they can be told apart from
+# Pauli gates that belong to the circuit
+NOISE_LABEL = 'pauli_noise'
+
+def _touch_error_probabilities(circuit: QuantumCircuit, 
+                               p1: float, 
+                               p2: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the Pauli error probability for every qubit touched by the circuit.
+    
+    Measurements are left noiseless since an error after readout cannot
+    change the result.
+    
+    Args:
+        circuit (QuantumCircuit): Input quantum circuit
+        p1 (float): Probability of error after single-qubit gates
+        p2 (float): Probability of error after two-qubit gates
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Error probability and gate arity per qubit touch
+    """
+    arities = np.array([len(instruction.qubits) for instruction in circuit.data], dtype=int)
+    is_gate = np.array([instruction.operation.name != 'measure' for instruction in circuit.data], dtype=bool)
+    gate_probs = np.where(is_gate, np.where(arities == 1, p1, p2), 0.0)
+    return np.repeat(gate_probs, arities), np.repeat(arities, arities)
 
 def add_quantum_noise(circuit: QuantumCircuit, 
                      p1: float, 
-                     p2: float) -> QuantumCircuit:
+                     p2: float,
+                     rng: Optional[np.random.Generator] = None) -> QuantumCircuit:
     """
     Adds Pauli noise to a quantum circuit after gates.
     
@@ -11,6 +40,8 @@ def add_quantum_noise(circuit: QuantumCircuit,
         circuit (QuantumCircuit): Input quantum circuit
         p1 (float): Probability of error after single-qubit gates (0 to 1)
         p2 (float): Probability of error after two-qubit gates (0 to 1)
+        rng (np.random.Generator, optional): Random generator to draw the
+            errors from; a fresh one is created if omitted
     
     Returns:
         QuantumCircuit: New circuit with added noise gates
@@ -22,70 +53,100 @@ def add_quantum_noise(circuit: QuantumCircuit,
     noisy_circuit = QuantumCircuit(circuit.num_qubits, circuit.num_clbits)
     
     # Pauli operators to choose from
-    pauli_ops = ['x', 'y', 'z']
+    pauli_ops = (XGate(label=NOISE_LABEL), YGate(label=NOISE_LABEL), ZGate(label=NOISE_LABEL))
+    
+    error_probs, _ = _touch_error_probabilities(circuit, p1, p2)
+    
+    # Draw all error events and Pauli choices in one shot
+    if rng is None:
+        rng = np.random.default_rng()
+    has_error = rng.random(error_probs.size) < error_probs
+    pauli_choices = rng.integers(0, len(pauli_ops), error_probs.size)
     
     # Process each instruction in the circuit
+    touch = 0
     for instruction in circuit.data:
-        gate = instruction[0]
-        qubits = instruction[1]
+        gate = instruction.operation
+        qubits = instruction.qubits
         
         # Add the original gate
-        noisy_circuit.append(gate, qubits)
-        
-        # Determine if it's a single or two-qubit gate
-        num_qubits = len(qubits)
-        error_prob = p1 if num_qubits == 1 else p2
+        noisy_circuit.append(gate, qubits, instruction.clbits)
         
-        # Apply random Pauli errors to each affected qubit
+        # Apply the sampled Pauli errors to each affected qubit
         for qubit in qubits:
-            if random.random() < error_prob:
-                # Randomly select a Pauli operator
-                pauli_error = random.choice(pauli_ops)
-                
-                # Apply the chosen Pauli operator
-                if pauli_error == 'x':
-                    noisy_circuit.x(qubit)
-                elif pauli_error == 'y':
-                    noisy_circuit.y(qubit)
-                else:  # z
-                    noisy_circuit.z(qubit)
-
-            noisy_circuit.measure_all()
+            if has_error[touch]:
+                noisy_circuit.append(pauli_ops[pauli_choices[touch]], [qubit])
+            touch += 1
+    
+    # Measure only circuits that have no classical bits to read out into
+    if circuit.num_clbits == 0:
+        noisy_circuit.measure_all()
     
     return noisy_circuit
 
 def analyze_noise_effect(circuit: QuantumCircuit, 
                         p1: float, 
                         p2: float, 
-                        num_samples: int = 100) -> dict:
+                        num_samples: Optional[int] = None,
+                        sample: bool = False) -> dict:
     """
     Analyzes the effect of noise by counting the number and types of errors added.
     
+    By default the expected error counts are computed in closed form; each
+    qubit touch independently fails with its gate's error probability and
+    picks one of the three Paulis uniformly.
+    
     Args:
         circuit (QuantumCircuit): Input quantum circuit
         p1 (float): Single-qubit gate error probability
         p2 (float): Two-qubit gate error probability
-        num_samples (int): Number of noisy circuits to generate for analysis
+        num_samples (int, optional): Number of noisy circuits to generate;
+            passing it implies sampling (defaults to 100 when sampling)
+        sample (bool): Estimate the averages by Monte-Carlo sampling of
+            add_quantum_noise instead, e.g. to validate the closed form
         
     Returns:
         dict: Statistics about the noise effects
     """
+    if not (0 <= p1 <= 1) or not (0 <= p2 <= 1):
+        raise ValueError("Probabilities must be between 0 and 1")
+    
+    if num_samples is None and not sample:
+        error_probs, arities = _touch_error_probabilities(circuit, p1, p2)
+        single_qubit = arities == 1
+        total_errors = float(error_probs.sum())
+        return {
+            'avg_x_errors': total_errors / 3,
+            'avg_y_errors': total_errors / 3,
+            'avg_z_errors': total_errors / 3,
+            'avg_single_qubit_errors': float(error_probs[single_qubit].sum()),
+            'avg_two_qubit_errors': float(error_probs[~single_qubit].sum())
+        }
+    
+    if num_samples is None:
+        num_samples = 100
+    
     total_errors = {'x': 0, 'y': 0, 'z': 0}
     total_single_qubit_errors = 0
     total_two_qubit_errors = 0
     
+    rng = np.random.default_rng()
     for _ in range(num_samples):
-        noisy_circuit = add_quantum_noise(circuit, p1, p2)
+        noisy_circuit = add_quantum_noise(circuit, p1, p2, rng=rng)
         
-        # Count errors in this sample
+        # Count injected errors, attributing each to the gate it follows
+        gate_arity = 0
         for instruction in noisy_circuit.data:
-            gate = instruction[0].name
-            if gate in ['x', 'y', 'z']:
-                total_errors[gate] += 1
-                if len(instruction[1]) == 1:
-                    total_single_qubit_errors += 1
-                else:
-                    total_two_qubit_errors += 1
+            operation = instruction.operation
+            if operation.label != NOISE_LABEL:
+                gate_arity = len(instruction.qubits)
+                continue
+            
+            total_errors[operation.name] += 1
+            if gate_arity == 1:
+                total_single_qubit_errors += 1
+            else:
+                total_two_qubit_errors += 1
     
     # Calculate averages
     stats = {